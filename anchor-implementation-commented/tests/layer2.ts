@@ -56,39 +56,18 @@ describe('Layer-2 Complete con BuyBot Enterprise', () => {
     // Airdrop di SOL per i test
     const connection = provider.connection;
     
-    // Airdrop al payer
-    const payerAirdropSignature = await connection.requestAirdrop(
-      payer.publicKey,
-      10 * LAMPORTS_PER_SOL
+    // Richiede tutti gli airdrop (payer, sequencer, token creator, utenti)
+    // e poi ne attende le conferme insieme, invece di uno alla volta
+    const airdropSignatures = await Promise.all([
+      connection.requestAirdrop(payer.publicKey, 10 * LAMPORTS_PER_SOL),
+      connection.requestAirdrop(sequencer.publicKey, 5 * LAMPORTS_PER_SOL),
+      connection.requestAirdrop(tokenCreator.publicKey, 5 * LAMPORTS_PER_SOL),
+      connection.requestAirdrop(user1.publicKey, 2 * LAMPORTS_PER_SOL),
+      connection.requestAirdrop(user2.publicKey, 2 * LAMPORTS_PER_SOL)
+    ]);
+    await Promise.all(
+      airdropSignatures.map(signature => connection.confirmTransaction(signature))
     );
-    await connection.confirmTransaction(payerAirdropSignature);
-    
-    // Airdrop al sequencer
-    const sequencerAirdropSignature = await connection.requestAirdrop(
-      sequencer.publicKey,
-      5 * LAMPORTS_PER_SOL
-    );
-    await connection.confirmTransaction(sequencerAirdropSignature);
-    
-    // Airdrop al token creator
-    const tokenCreatorAirdropSignature = await connection.requestAirdrop(
-      tokenCreator.publicKey,
-      5 * LAMPORTS_PER_SOL
-    );
-    await connection.confirmTransaction(tokenCreatorAirdropSignature);
-    
-    // Airdrop agli utenti
-    const user1AirdropSignature = await connection.requestAirdrop(
-      user1.publicKey,
-      2 * LAMPORTS_PER_SOL
-    );
-    await connection.confirmTransaction(user1AirdropSignature);
-    
-    const user2AirdropSignature = await connection.requestAirdrop(
-      user2.publicKey,
-      2 * LAMPORTS_PER_SOL
-    );
-    await connection.confirmTransaction(user2AirdropSignature);
     
     // Trova gli indirizzi PDA
     [layer2State] = await PublicKey.findProgramAddress(
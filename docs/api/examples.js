@@ -11,15 +11,17 @@
 const API_BASE_URL = 'https://api.layer2.solana.com/v1';
 let authToken = null;
 
+// Request settings shared by every API call
+const JSON_HEADERS = {
+  'Content-Type': 'application/json',
+};
+const METHODS_WITH_BODY = new Set(['POST', 'PUT', 'PATCH']);
+
 // Utility function for making API requests
 async function apiRequest(endpoint, method = 'GET', body = null) {
-  const headers = {
-    'Content-Type': 'application/json',
-  };
-  
-  if (authToken) {
-    headers['Authorization'] = `Bearer ${authToken}`;
-  }
+  const headers = authToken
+    ? { ...JSON_HEADERS, 'Authorization': `Bearer ${authToken}` }
+    : JSON_HEADERS;
   
   const options = {
     method,
@@ -27,7 +29,7 @@ async function apiRequest(endpoint, method = 'GET', body = null) {
     credentials: 'include',
   };
   
-  if (body && (method === 'POST' || method === 'PUT' || method === 'PATCH')) {
+  if (body && METHODS_WITH_BODY.has(method)) {
     options.body = JSON.stringify(body);
   }
   
@@ -182,8 +184,13 @@ async function exampleUsage() {
     
     // If the system is healthy, proceed with other operations
     if (systemStatus.status === 'healthy') {
-      // Get sequencer status
-      const sequencerStatus = await getSequencerStatus();
+      // The sequencer status, node list and secret list are independent reads,
+      // so they are requested concurrently
+      const [sequencerStatus, nodesResult, secretsResult] = await Promise.all([
+        getSequencerStatus(),
+        getNodes(),
+        listSecrets()
+      ]);
       
       // Submit a transaction
       if (sequencerStatus.state === 'running') {
@@ -195,9 +202,6 @@ async function exampleUsage() {
         }
       }
       
-      // Get the list of nodes
-      const nodesResult = await getNodes();
-      
       // If there are inactive nodes, start synchronization
       if (nodesResult.nodes.some(node => node.state !== 'leader')) {
         const inactiveNode = nodesResult.nodes.find(node => node.state !== 'leader');
@@ -206,9 +210,6 @@ async function exampleUsage() {
         }
       }
       
-      // Manage secrets
-      const secretsResult = await listSecrets();
-      
       // Create a new secret if it doesn't exist
       if (!secretsResult.secrets.includes('api-key')) {
         await createSecret('api-key', 'my-secret-api-key');
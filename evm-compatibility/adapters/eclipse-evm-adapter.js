@@ -5,10 +5,12 @@
  * to be executed on Solana Layer 2 using Eclipse's infrastructure.
  */
 
-const { Connection, PublicKey, Transaction } = require('@solana/web3.js');
+const { PublicKey } = require('@solana/web3.js');
 const { ethers } = require('ethers');
 const { Buffer } = require('buffer');
 const axios = require('axios');
+const http = require('http');
+const https = require('https');
 
 /**
  * Eclipse EVM Adapter
@@ -22,11 +24,43 @@ module.exports = function(config) {
     eclipseProgramId: 'EVM1111111111111111111111111111111111111111',
     gasPrice: '0x3b9aca00', // 1 Gwei
     gasLimit: '0x5f5e100', // 100,000,000
+    rpcMaxSockets: 32, // Concurrent connections to the RPC endpoint
+    rpcMaxRetries: 3, // Retries for transient RPC failures
   };
   
   // Merge with provided config
   const adapterConfig = { ...defaultConfig, ...config };
   
+  // HTTP client shared by all RPC calls of this adapter, keeping connections alive
+  const agentOptions = { keepAlive: true, maxSockets: adapterConfig.rpcMaxSockets };
+  const rpcClient = axios.create({
+    httpAgent: new http.Agent(agentOptions),
+    httpsAgent: new https.Agent(agentOptions)
+  });
+  
+  // Retry transient failures (dropped connections, gateway errors) with a short backoff;
+  // every RPC method used by this adapter is read-only, so retrying is safe
+  const RETRYABLE_STATUS = new Set([502, 503, 504]);
+  const RETRYABLE_CODES = new Set(['ECONNRESET', 'ECONNREFUSED', 'ETIMEDOUT', 'EPIPE']);
+  
+  rpcClient.interceptors.response.use(undefined, async (error) => {
+    const request = error.config;
+    const retryable = error.response
+      ? RETRYABLE_STATUS.has(error.response.status)
+      : RETRYABLE_CODES.has(error.code);
+    
+    if (!request || !retryable || (request.retryCount || 0) >= adapterConfig.rpcMaxRetries) {
+      throw error;
+    }
+    
+    request.retryCount = (request.retryCount || 0) + 1;
+    await new Promise(resolve => setTimeout(resolve, 100 * 2 ** (request.retryCount - 1)));
+    return rpcClient(request);
+  });
+  
+  // Deployed bytecode does not change, so it is fetched once per cluster endpoint and contract account
+  const contractCodeCache = new Map();
+  
   // Convert program ID to PublicKey
   const eclipseProgramId = new PublicKey(adapterConfig.eclipseProgramId);
   
@@ -69,7 +103,7 @@ module.exports = function(config) {
       };
       
       // Send request to Eclipse RPC
-      const response = await axios.post(adapterConfig.eclipseRpcUrl, callRequest);
+      const response = await rpcClient.post(adapterConfig.eclipseRpcUrl, callRequest);
       
       if (response.data.error) {
         throw new Error(`Eclipse EVM call failed: ${response.data.error.message}`);
@@ -114,7 +148,7 @@ module.exports = function(config) {
       };
       
       // Send request to Eclipse RPC
-      const response = await axios.post(adapterConfig.eclipseRpcUrl, stateRequest);
+      const response = await rpcClient.post(adapterConfig.eclipseRpcUrl, stateRequest);
       
       if (response.data.error) {
         throw new Error(`Eclipse EVM state retrieval failed: ${response.data.error.message}`);
@@ -172,7 +206,7 @@ module.exports = function(config) {
       };
       
       // Send request to Eclipse RPC
-      const response = await axios.post(adapterConfig.eclipseRpcUrl, logsRequest);
+      const response = await rpcClient.post(adapterConfig.eclipseRpcUrl, logsRequest);
       
       if (response.data.error) {
         throw new Error(`Eclipse EVM logs retrieval failed: ${response.data.error.message}`);
@@ -191,6 +225,11 @@ module.exports = function(config) {
    * @returns {string} Contract bytecode (hex string)
    */
   async function getContractCode(connection, contractAccount) {
+    const cacheKey = `${connection.rpcEndpoint}:${contractAccount.toBase58()}`;
+    if (contractCodeCache.has(cacheKey)) {
+      return contractCodeCache.get(cacheKey);
+    }
+    
     try {
       // Get contract state account data
       const accountInfo = await connection.getAccountInfo(contractAccount);
@@ -213,13 +252,19 @@ module.exports = function(config) {
       };
       
       // Send request to Eclipse RPC
-      const response = await axios.post(adapterConfig.eclipseRpcUrl, codeRequest);
+      const response = await rpcClient.post(adapterConfig.eclipseRpcUrl, codeRequest);
       
       if (response.data.error) {
         throw new Error(`Eclipse EVM code retrieval failed: ${response.data.error.message}`);
       }
       
-      return response.data.result;
+      // An empty result means nothing is deployed yet; only cache real bytecode
+      const code = response.data.result;
+      if (code && code !== '0x') {
+        contractCodeCache.set(cacheKey, code);
+      }
+      
+      return code;
     } catch (error) {
       throw new Error(`Eclipse EVM adapter code retrieval failed: ${error.message}`);
     }
@@ -258,7 +303,7 @@ module.exports = function(config) {
       };
       
       // Send request to Eclipse RPC
-      const response = await axios.post(adapterConfig.eclipseRpcUrl, gasRequest);
+      const response = await rpcClient.post(adapterConfig.eclipseRpcUrl, gasRequest);
       
       if (response.data.error) {
         throw new Error(`Eclipse EVM gas estimation failed: ${response.data.error.message}`);
@@ -309,7 +354,7 @@ module.exports = function(config) {
       };
       
       // Send request to Eclipse RPC
-      const response = await axios.post(adapterConfig.eclipseRpcUrl, receiptRequest);
+      const response = await rpcClient.post(adapterConfig.eclipseRpcUrl, receiptRequest);
       
       if (response.data.error) {
         throw new Error(`Eclipse EVM receipt retrieval failed: ${response.data.error.message}`);
@@ -350,7 +395,7 @@ module.exports = function(config) {
       };
       
       // Send request to Eclipse RPC
-      const response = await axios.post(adapterConfig.eclipseRpcUrl, countRequest);
+      const response = await rpcClient.post(adapterConfig.eclipseRpcUrl, countRequest);
       
       if (response.data.error) {
         throw new Error(`Eclipse EVM transaction count retrieval failed: ${response.data.error.message}`);
@@ -384,7 +429,7 @@ module.exports = function(config) {
       };
       
       // Send request to Eclipse RPC
-      const response = await axios.post(adapterConfig.eclipseRpcUrl, balanceRequest);
+      const response = await rpcClient.post(adapterConfig.eclipseRpcUrl, balanceRequest);
       
       if (response.data.error) {
         throw new Error(`Eclipse EVM balance retrieval failed: ${response.data.error.message}`);
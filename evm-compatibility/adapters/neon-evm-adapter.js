@@ -5,10 +5,12 @@
  * to be executed on Solana Layer 2 using Neon EVM's infrastructure.
  */
 
-const { Connection, PublicKey, Transaction } = require('@solana/web3.js');
+const { PublicKey } = require('@solana/web3.js');
 const { ethers } = require('ethers');
 const { Buffer } = require('buffer');
 const axios = require('axios');
+const http = require('http');
+const https = require('https');
 
 /**
  * Neon EVM Adapter
@@ -23,11 +25,43 @@ module.exports = function(config) {
     neonAccountStorage: 'NeonEVMAccountStoragexfBxXBR9vfJ9Ua4Khaj',
     gasPrice: '0x3b9aca00', // 1 Gwei
     gasLimit: '0x5f5e100', // 100,000,000
+    rpcMaxSockets: 32, // Concurrent connections to the RPC endpoint
+    rpcMaxRetries: 3, // Retries for transient RPC failures
   };
   
   // Merge with provided config
   const adapterConfig = { ...defaultConfig, ...config };
   
+  // HTTP client shared by all RPC calls of this adapter, keeping connections alive
+  const agentOptions = { keepAlive: true, maxSockets: adapterConfig.rpcMaxSockets };
+  const rpcClient = axios.create({
+    httpAgent: new http.Agent(agentOptions),
+    httpsAgent: new https.Agent(agentOptions)
+  });
+  
+  // Retry transient failures (dropped connections, gateway errors) with a short backoff;
+  // every RPC method used by this adapter is read-only, so retrying is safe
+  const RETRYABLE_STATUS = new Set([502, 503, 504]);
+  const RETRYABLE_CODES = new Set(['ECONNRESET', 'ECONNREFUSED', 'ETIMEDOUT', 'EPIPE']);
+  
+  rpcClient.interceptors.response.use(undefined, async (error) => {
+    const request = error.config;
+    const retryable = error.response
+      ? RETRYABLE_STATUS.has(error.response.status)
+      : RETRYABLE_CODES.has(error.code);
+    
+    if (!request || !retryable || (request.retryCount || 0) >= adapterConfig.rpcMaxRetries) {
+      throw error;
+    }
+    
+    request.retryCount = (request.retryCount || 0) + 1;
+    await new Promise(resolve => setTimeout(resolve, 100 * 2 ** (request.retryCount - 1)));
+    return rpcClient(request);
+  });
+  
+  // Deployed bytecode does not change, so it is fetched once per cluster endpoint and contract account
+  const contractCodeCache = new Map();
+  
   // Convert program ID to PublicKey
   const neonEvmProgramId = new PublicKey(adapterConfig.neonEvmProgramId);
   const neonAccountStorage = new PublicKey(adapterConfig.neonAccountStorage);
@@ -71,7 +105,7 @@ module.exports = function(config) {
       };
       
       // Send request to Neon Proxy
-      const response = await axios.post(adapterConfig.neonProxyUrl, callRequest);
+      const response = await rpcClient.post(adapterConfig.neonProxyUrl, callRequest);
       
       if (response.data.error) {
         throw new Error(`Neon EVM call failed: ${response.data.error.message}`);
@@ -116,7 +150,7 @@ module.exports = function(config) {
       };
       
       // Send request to Neon Proxy
-      const response = await axios.post(adapterConfig.neonProxyUrl, stateRequest);
+      const response = await rpcClient.post(adapterConfig.neonProxyUrl, stateRequest);
       
       if (response.data.error) {
         throw new Error(`Neon EVM state retrieval failed: ${response.data.error.message}`);
@@ -174,7 +208,7 @@ module.exports = function(config) {
       };
       
       // Send request to Neon Proxy
-      const response = await axios.post(adapterConfig.neonProxyUrl, logsRequest);
+      const response = await rpcClient.post(adapterConfig.neonProxyUrl, logsRequest);
       
       if (response.data.error) {
         throw new Error(`Neon EVM logs retrieval failed: ${response.data.error.message}`);
@@ -193,6 +227,11 @@ module.exports = function(config) {
    * @returns {string} Contract bytecode (hex string)
    */
   async function getContractCode(connection, contractAccount) {
+    const cacheKey = `${connection.rpcEndpoint}:${contractAccount.toBase58()}`;
+    if (contractCodeCache.has(cacheKey)) {
+      return contractCodeCache.get(cacheKey);
+    }
+    
     try {
       // Get contract state account data
       const accountInfo = await connection.getAccountInfo(contractAccount);
@@ -215,13 +254,19 @@ module.exports = function(config) {
       };
       
       // Send request to Neon Proxy
-      const response = await axios.post(adapterConfig.neonProxyUrl, codeRequest);
+      const response = await rpcClient.post(adapterConfig.neonProxyUrl, codeRequest);
       
       if (response.data.error) {
         throw new Error(`Neon EVM code retrieval failed: ${response.data.error.message}`);
       }
       
-      return response.data.result;
+      // An empty result means nothing is deployed yet; only cache real bytecode
+      const code = response.data.result;
+      if (code && code !== '0x') {
+        contractCodeCache.set(cacheKey, code);
+      }
+      
+      return code;
     } catch (error) {
       throw new Error(`Neon EVM adapter code retrieval failed: ${error.message}`);
     }
@@ -260,7 +305,7 @@ module.exports = function(config) {
       };
       
       // Send request to Neon Proxy
-      const response = await axios.post(adapterConfig.neonProxyUrl, gasRequest);
+      const response = await rpcClient.post(adapterConfig.neonProxyUrl, gasRequest);
       
       if (response.data.error) {
         throw new Error(`Neon EVM gas estimation failed: ${response.data.error.message}`);
@@ -307,7 +352,7 @@ module.exports = function(config) {
       };
       
       // Send request to Neon Proxy
-      const response = await axios.post(adapterConfig.neonProxyUrl, receiptRequest);
+      const response = await rpcClient.post(adapterConfig.neonProxyUrl, receiptRequest);
       
       if (response.data.error) {
         throw new Error(`Neon EVM receipt retrieval failed: ${response.data.error.message}`);
@@ -348,7 +393,7 @@ module.exports = function(config) {
       };
       
       // Send request to Neon Proxy
-      const response = await axios.post(adapterConfig.neonProxyUrl, countRequest);
+      const response = await rpcClient.post(adapterConfig.neonProxyUrl, countRequest);
       
       if (response.data.error) {
         throw new Error(`Neon EVM transaction count retrieval failed: ${response.data.error.message}`);
@@ -382,7 +427,7 @@ module.exports = function(config) {
       };
       
       // Send request to Neon Proxy
-      const response = await axios.post(adapterConfig.neonProxyUrl, balanceRequest);
+      const response = await rpcClient.post(adapterConfig.neonProxyUrl, balanceRequest);
       
       if (response.data.error) {
         throw new Error(`Neon EVM balance retrieval failed: ${response.data.error.message}`);
@@ -99,21 +99,14 @@ describe('token_program', () => {
   
   // Setup before tests
   before(async () => {
-    // Airdrop SOL to test accounts
-    await provider.connection.confirmTransaction(
-      await provider.connection.requestAirdrop(tokenAuthority.publicKey, 10 * anchor.web3.LAMPORTS_PER_SOL)
+    // Airdrop SOL to test accounts: submit every request first, then wait for all confirmations together
+    const airdropSignatures = await Promise.all(
+      [tokenAuthority, tokenMintAuthority, user1, user2].map(account =>
+        provider.connection.requestAirdrop(account.publicKey, 10 * anchor.web3.LAMPORTS_PER_SOL)
+      )
     );
-    
-    await provider.connection.confirmTransaction(
-      await provider.connection.requestAirdrop(tokenMintAuthority.publicKey, 10 * anchor.web3.LAMPORTS_PER_SOL)
-    );
-    
-    await provider.connection.confirmTransaction(
-      await provider.connection.requestAirdrop(user1.publicKey, 10 * anchor.web3.LAMPORTS_PER_SOL)
-    );
-    
-    await provider.connection.confirmTransaction(
-      await provider.connection.requestAirdrop(user2.publicKey, 10 * anchor.web3.LAMPORTS_PER_SOL)
+    await Promise.all(
+      airdropSignatures.map(signature => provider.connection.confirmTransaction(signature))
     );
     
     // Create token mint
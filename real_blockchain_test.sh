@@ -17,9 +17,13 @@ TEST_WALLET="test-wallet.json"
 TEST_AMOUNT=0.01
 LOG_FILE="./test_results/blockchain_test_$(date +%Y%m%d_%H%M%S).log"
 
-# Log function
+# Log function; writes the line itself instead of piping through tee. The timestamp
+# still comes from date, since printf's %(...)T needs bash 4.2+ (macOS ships 3.2)
 log() {
-    echo "[$(date +"%Y-%m-%d %H:%M:%S")] $1" | tee -a "$LOG_FILE"
+    local line
+    line="[$(date +"%Y-%m-%d %H:%M:%S")] $1"
+    echo "$line"
+    echo "$line" >> "$LOG_FILE"
 }
 
 # Check if Solana CLI is installed
@@ -80,8 +84,6 @@ test_deposit() {
     # Replace with actual deposit command
     # ./layer2_cli.sh deposit --amount $TEST_AMOUNT --token SOL --wallet "$TEST_WALLET"
     
-    # Simulate deposit for testing
-    sleep 2
     log "Deposit transaction simulated."
     
     # Get wallet balance after deposit
@@ -109,8 +111,6 @@ test_layer2_transaction() {
     # Replace with actual Layer-2 transaction command
     # ./layer2_cli.sh transfer --to "$RECIPIENT_ADDRESS" --amount $TEST_AMOUNT --token SOL --wallet "$TEST_WALLET"
     
-    # Simulate transaction for testing
-    sleep 2
     log "Layer-2 transaction simulated."
     
     log "Layer-2 transaction test completed."
@@ -129,8 +129,6 @@ test_withdrawal() {
     # Replace with actual withdrawal command
     # ./layer2_cli.sh withdraw --amount $TEST_AMOUNT --token SOL --wallet "$TEST_WALLET"
     
-    # Simulate withdrawal for testing
-    sleep 2
     log "Withdrawal transaction simulated."
     
     # Get wallet balance after withdrawal
@@ -156,8 +154,6 @@ test_fraud_proof_real() {
     log "Submitting fraud proof to Layer-1..."
     # Replace with actual fraud proof submission command
     
-    # Simulate fraud proof verification
-    sleep 3
     log "Fraud proof verification simulated."
     
     log "Fraud proof real blockchain test completed."
@@ -177,7 +173,6 @@ test_finalization_real() {
     
     # Wait for challenge period
     log "Waiting for challenge period (simulated)..."
-    sleep 3
     
     # Finalize block
     log "Finalizing block..."
@@ -14,6 +14,8 @@ const path = require('path');
 const crypto = require('crypto');
 const winston = require('winston');
 const axios = require('axios');
+const http = require('http');
+const https = require('https');
 
 const logger = winston.createLogger({
   level: 'info',
@@ -73,6 +75,12 @@ class NFTRelayer {
     this.pendingProcessInterval = null;
     this.stateSaveInterval = null;
     this.metricsInterval = null;
+    
+    // Metrics are pushed on every interval, so keep the connection to the endpoint open
+    this.metricsClient = axios.create({
+      httpAgent: new http.Agent({ keepAlive: true }),
+      httpsAgent: new https.Agent({ keepAlive: true })
+    });
   }
   
   /**
@@ -553,7 +561,7 @@ class NFTRelayer {
         circuitBreakerActive: this.circuitBreakerActive
       };
       
-      axios.post(this.config.metricsEndpoint, {
+      this.metricsClient.post(this.config.metricsEndpoint, {
         component: 'nft-relayer',
         metrics: componentMetrics
       }).catch(error => {
@@ -9,62 +9,84 @@ echo "Data: $(date)"
 echo
 
 # Colori per l'output
-GREEN='\033[0;32m'
-RED='\033[0;31m'
-YELLOW='\033[0;33m'
-NC='\033[0m' # No Color
+GREEN=$'\033[0;32m'
+RED=$'\033[0;31m'
+YELLOW=$'\033[0;33m'
+NC=$'\033[0m' # No Color
 
-# Directory di lavoro
-WORK_DIR="/home/ubuntu/github-upload/LAYER-2-COMPLETE"
-cd $WORK_DIR
+# Esiti già colorati, composti una sola volta
+STATUS_OK="${GREEN}OK${NC}"
+STATUS_FAILED="${RED}FALLITO${NC}"
+STATUS_SKIPPED="${YELLOW}SALTATO${NC}"
+
+# Directory di lavoro: la radice del repository, risolta una sola volta dalla posizione dello script
+WORK_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")/.." && pwd)"
+cd "$WORK_DIR"
+
+# Directory per i log dei moduli e l'output dei singoli comandi
+LOG_DIR=$(mktemp -d)
+
+# Esegue un comando salvandone l'output in $step_log invece di scartarlo
+run_quiet() {
+    "$@" > "$step_log" 2>&1
+}
+
+# Mostra le ultime righe dell'output dell'ultimo comando fallito
+show_step_log() {
+    tail -n 20 "$step_log" | sed 's/^/    /'
+}
 
 # Funzione per eseguire i test in un sottomodulo
 run_tests() {
     local module=$1
     local module_dir=$2
+    local step_log="$LOG_DIR/$module.out"
     
     echo -e "\n=== Testando il modulo $module ==="
     
-    cd $module_dir
+    cd "$module_dir" || return 1
     
     echo -n "Installazione delle dipendenze... "
-    if npm install --no-audit --no-fund > /dev/null 2>&1; then
-        echo -e "${GREEN}OK${NC}"
+    if run_quiet npm install --no-audit --no-fund; then
+        echo "$STATUS_OK"
     else
-        echo -e "${RED}FALLITO${NC}"
+        echo "$STATUS_FAILED"
         echo "Errore durante l'installazione delle dipendenze in $module"
+        show_step_log
         return 1
     fi
     
     if [ -f "package.json" ]; then
         if grep -q "\"test\":" "package.json"; then
             echo -n "Esecuzione dei test... "
-            if npm test --silent > /dev/null 2>&1; then
-                echo -e "${GREEN}OK${NC}"
+            if run_quiet npm test --silent; then
+                echo "$STATUS_OK"
             else
-                echo -e "${RED}FALLITO${NC}"
+                echo "$STATUS_FAILED"
                 echo "Errore durante l'esecuzione dei test in $module"
+                show_step_log
                 return 1
             fi
         else
-            echo -e "Nessun test configurato in $module... ${YELLOW}SALTATO${NC}"
+            echo "Nessun test configurato in $module... $STATUS_SKIPPED"
         fi
         
         if grep -q "\"build\":" "package.json"; then
             echo -n "Esecuzione del build... "
-            if npm run build --silent > /dev/null 2>&1; then
-                echo -e "${GREEN}OK${NC}"
+            if run_quiet npm run build --silent; then
+                echo "$STATUS_OK"
             else
-                echo -e "${RED}FALLITO${NC}"
+                echo "$STATUS_FAILED"
                 echo "Errore durante l'esecuzione del build in $module"
+                show_step_log
                 return 1
             fi
         else
-            echo -e "Nessun build configurato in $module... ${YELLOW}SALTATO${NC}"
+            echo "Nessun build configurato in $module... $STATUS_SKIPPED"
         fi
     fi
     
-    cd $WORK_DIR
+    cd "$WORK_DIR"
     return 0
 }
 
@@ -72,37 +94,59 @@ run_tests() {
 test_rust_dependencies() {
     echo -e "\n=== Testando le dipendenze Rust ==="
     
-    cd $WORK_DIR/onchain
+    local step_log="$LOG_DIR/rust.out"
+    
+    cd "$WORK_DIR/onchain" || return 1
     
+    # Riutilizza la cache incrementale tra un'esecuzione e l'altra
+    export CARGO_INCREMENTAL=1
+    
+    # Scarica le dipendenze una sola volta; i passi successivi non interrogano il registry
+    echo -n "Download delle dipendenze Rust... "
+    if run_quiet cargo fetch --quiet; then
+        echo "$STATUS_OK"
+    else
+        echo "$STATUS_FAILED"
+        echo "Errore durante il download delle dipendenze Rust"
+        show_step_log
+        return 1
+    fi
+    
+    # Compila una sola volta anche i target di test: cargo test li riutilizza subito dopo
     echo -n "Verifica della compilazione... "
-    if cargo check --quiet > /dev/null 2>&1; then
-        echo -e "${GREEN}OK${NC}"
+    if run_quiet cargo test --offline --no-run --quiet; then
+        echo "$STATUS_OK"
     else
-        echo -e "${RED}FALLITO${NC}"
+        echo "$STATUS_FAILED"
         echo "Errore durante la verifica della compilazione Rust"
+        show_step_log
         return 1
     fi
     
     echo -n "Esecuzione dei test Rust... "
-    if cargo test --quiet > /dev/null 2>&1; then
-        echo -e "${GREEN}OK${NC}"
+    if run_quiet cargo test --offline --quiet; then
+        echo "$STATUS_OK"
     else
-        echo -e "${RED}FALLITO${NC}"
+        echo "$STATUS_FAILED"
         echo "Errore durante l'esecuzione dei test Rust"
+        show_step_log
         return 1
     fi
     
-    cd $WORK_DIR
+    cd "$WORK_DIR"
     return 0
 }
 
 # Installa le dipendenze principali
+step_log="$LOG_DIR/main.out"
 echo -n "Installazione delle dipendenze principali... "
-if npm install --no-audit --no-fund > /dev/null 2>&1; then
-    echo -e "${GREEN}OK${NC}"
+if run_quiet npm install --no-audit --no-fund; then
+    echo "$STATUS_OK"
 else
-    echo -e "${RED}FALLITO${NC}"
+    echo "$STATUS_FAILED"
     echo "Errore durante l'installazione delle dipendenze principali"
+    show_step_log
+    rm -rf "$LOG_DIR"
     exit 1
 fi
 
@@ -117,26 +161,44 @@ modules=(
 
 errors=0
 
+# I sottomoduli sono indipendenti: li testiamo in parallelo, ciascuno con il proprio log
+pids=()
+
 for module in "${modules[@]}"; do
     IFS=':' read -r name dir <<< "$module"
-    if ! run_tests "$name" "$dir"; then
+    run_tests "$name" "$dir" > "$LOG_DIR/$name.log" 2>&1 &
+    pids+=($!)
+done
+
+# La compilazione Rust non dipende dai moduli npm: la sovrapponiamo a loro
+test_rust_dependencies > "$LOG_DIR/rust.log" 2>&1 &
+rust_pid=$!
+
+# Mostra l'output nell'ordine originale dei moduli
+for i in "${!modules[@]}"; do
+    IFS=':' read -r name dir <<< "${modules[$i]}"
+    if ! wait "${pids[$i]}"; then
         ((errors++))
     fi
+    cat "$LOG_DIR/$name.log"
 done
 
 # Testa le dipendenze Rust
-if ! test_rust_dependencies; then
+if ! wait "$rust_pid"; then
     ((errors++))
 fi
+cat "$LOG_DIR/rust.log"
+
+rm -rf "$LOG_DIR"
 
 # Risultato finale
 echo -e "\n=== Risultato finale ==="
 
 if [ $errors -eq 0 ]; then
-    echo -e "${GREEN}Tutte le dipendenze aggiornate sono compatibili con il codice esistente.${NC}"
+    echo "${GREEN}Tutte le dipendenze aggiornate sono compatibili con il codice esistente.${NC}"
     echo "L'aggiornamento delle dipendenze è stato completato con successo."
 else
-    echo -e "${RED}Sono stati rilevati $errors errori durante i test di compatibilità.${NC}"
+    echo "${RED}Sono stati rilevati $errors errori durante i test di compatibilità.${NC}"
     echo "Correggere gli errori prima di procedere con l'aggiornamento delle dipendenze."
 fi
 
@@ -520,11 +520,13 @@ export class BundleEngine {
       bundle.processed = true;
       this.bundles.set(bundleId, bundle);
       
+      const successCount = results.filter(r => r.success).length;
+      
       this.logger.info('Bundle processed successfully', {
         bundleId,
         transactionCount: bundle.transactions.length,
-        successCount: results.filter(r => r.success).length,
-        failureCount: results.filter(r => !r.success).length
+        successCount,
+        failureCount: results.length - successCount
       });
       
       return true;
@@ -584,10 +586,12 @@ export class BundleEngine {
         }
       }
       
+      const successCount = results.filter(r => r.success).length;
+      
       this.logger.info('Transactions processed', {
         count: transactions.length,
-        successCount: results.filter(r => r.success).length,
-        failureCount: results.filter(r => !r.success).length
+        successCount,
+        failureCount: results.length - successCount
       });
       
       return results;
@@ -459,12 +459,14 @@ export class OptimizedBundleEngine extends EventEmitter {
     processingTimeMs: number
   }): void {
     try {
+      const successCount = result.transactions.filter(tx => tx.success).length;
+      
       this.logger.info(`Received bundle result from worker ${workerId}`, {
         bundleId: result.bundleId,
         success: result.success,
         transactionCount: result.transactions.length,
-        successCount: result.transactions.filter(tx => tx.success).length,
-        failureCount: result.transactions.filter(tx => !tx.success).length,
+        successCount,
+        failureCount: result.transactions.length - successCount,
         processingTimeMs: result.processingTimeMs
       });
       
@@ -584,11 +586,13 @@ export class OptimizedBundleEngine extends EventEmitter {
     processingTimeMs: number
   }): void {
     try {
+      const successCount = result.transactions.filter(tx => tx.success).length;
+      
       this.logger.info(`Received transaction batch result from worker ${workerId}`, {
         batchId: result.batchId,
         transactionCount: result.transactions.length,
-        successCount: result.transactions.filter(tx => tx.success).length,
-        failureCount: result.transactions.filter(tx => !tx.success).length,
+        successCount,
+        failureCount: result.transactions.length - successCount,
         processingTimeMs: result.processingTimeMs
       });
       
@@ -1637,11 +1641,13 @@ if (!isMainThread) {
       
       const processingTimeMs = Date.now() - startTime;
       
+      const successCount = results.filter(r => r.success).length;
+      
       logger.info('Bundle processed', {
         bundleId: data.bundleId,
         transactionCount: data.transactions.length,
-        successCount: results.filter(r => r.success).length,
-        failureCount: results.filter(r => !r.success).length,
+        successCount,
+        failureCount: results.length - successCount,
         processingTimeMs
       });
       
@@ -1650,7 +1656,7 @@ if (!isMainThread) {
         type: WorkerMessageType.BUNDLE_RESULT,
         data: {
           bundleId: data.bundleId,
-          success: results.filter(r => r.success).length > 0,
+          success: successCount > 0,
           transactions: results,
           processingTimeMs
         }
@@ -1710,11 +1716,13 @@ if (!isMainThread) {
       
       const processingTimeMs = Date.now() - startTime;
       
+      const successCount = results.filter(r => r.success).length;
+      
       logger.info('Transaction batch processed', {
         batchId: data.batchId,
         transactionCount: data.transactions.length,
-        successCount: results.filter(r => r.success).length,
-        failureCount: results.filter(r => !r.success).length,
+        successCount,
+        failureCount: results.length - successCount,
         processingTimeMs
       });
       
@@ -10,8 +10,7 @@
 import { 
   Connection, 
   PublicKey, 
-  Keypair, 
-  Transaction
+  Keypair
 } from '@solana/web3.js';
 import { Logger } from './utils/logger';
 import { NeonEVMIntegration } from './neon_evm_integration';
@@ -26,7 +25,30 @@ import { TestingFramework, PerformanceMetrics } from './testing_framework';
 import * as crypto from 'crypto';
 import * as fs from 'fs';
 import * as path from 'path';
-import * as os from 'os';
+
+/**
+ * Error types reported by simulated transaction failures
+ */
+const SIMULATED_ERROR_TYPES: readonly string[] = [
+  'timeout',
+  'insufficient_funds',
+  'nonce_too_low',
+  'gas_price_too_low',
+  'execution_reverted',
+  'rate_limited',
+  'network_congestion'
+];
+
+/**
+ * Transaction types produced by the mixed transaction generator
+ */
+const MIXED_TRANSACTION_TYPES: readonly string[] = [
+  'transfer',
+  'swap',
+  'contract_call',
+  'liquidity_add',
+  'liquidity_remove'
+];
 
 /**
  * Configuration options for the stress test runner
@@ -123,6 +145,8 @@ export class StressTestRunner {
   private testResults: StressTestResult[] = [];
   private monitoringInterval: NodeJS.Timeout | null = null;
   private isRunning: boolean = false;
+  private txSequence: number = 0;
+  private readonly txIdPrefix: string = crypto.randomBytes(8).toString('hex');
 
   /**
    * Creates a new instance of StressTestRunner
@@ -217,9 +241,11 @@ export class StressTestRunner {
       // Save test results
       this.saveTestResults();
       
+      const { totalTests, successfulTests } = this.summarizeTestResults();
+      
       this.logger.info('All stress tests completed', {
-        totalTests: this.testResults.length,
-        successfulTests: this.testResults.filter(r => r.targetAchieved).length
+        totalTests,
+        successfulTests
       });
       
       return this.testResults;
@@ -396,19 +422,26 @@ export class StressTestRunner {
    * @private
    */
   private createSimpleTransactionGenerator(): TransactionGenerator {
+    const from = this.testKeypair.publicKey.toBase58();
+    
     return {
       generateTransactionBatch: async (batchSize: number) => {
         // In a real implementation, this would generate actual transactions
         // For now, we'll generate dummy transaction data
         const transactions = [];
+        // One random draw for the whole batch: each transaction takes a 32-byte
+        // recipient key followed by a 64-byte payload
+        const entropy = crypto.randomBytes(batchSize * (32 + 64));
         
         for (let i = 0; i < batchSize; i++) {
+          const offset = i * (32 + 64);
+          
           transactions.push({
-            id: `tx_${Date.now()}_${i}_${crypto.randomBytes(4).toString('hex')}`,
-            from: this.testKeypair.publicKey.toBase58(),
-            to: new PublicKey(crypto.randomBytes(32)).toBase58(),
+            id: `tx_${this.txIdPrefix}_${this.txSequence++}`,
+            from,
+            to: new PublicKey(entropy.subarray(offset, offset + 32)).toBase58(),
             value: BigInt(Math.floor(Math.random() * 1000000)),
-            data: crypto.randomBytes(64).toString('hex'),
+            data: entropy.toString('hex', offset + 32, offset + 32 + 64),
             gas: 21000 + Math.floor(Math.random() * 10000),
             type: 'transfer'
           });
@@ -426,24 +459,34 @@ export class StressTestRunner {
    * @private
    */
   private createMixedTransactionGenerator(): TransactionGenerator {
+    const from = this.testKeypair.publicKey.toBase58();
+    
     return {
       generateTransactionBatch: async (batchSize: number) => {
         // In a real implementation, this would generate actual transactions
         // of different types (transfers, swaps, contract calls, etc.)
         // For now, we'll generate dummy transaction data
         const transactions = [];
-        const types = ['transfer', 'swap', 'contract_call', 'liquidity_add', 'liquidity_remove'];
+        // Pick all types first so the random bytes for the whole batch can be drawn at once
+        const batchTypes = Array.from(
+          { length: batchSize },
+          () => MIXED_TRANSACTION_TYPES[Math.floor(Math.random() * MIXED_TRANSACTION_TYPES.length)]
+        );
+        const dataSizes = batchTypes.map(type => type === 'contract_call' ? 256 : 64);
+        const entropy = crypto.randomBytes(dataSizes.reduce((total, size) => total + 32 + size, 0));
+        let offset = 0;
         
         for (let i = 0; i < batchSize; i++) {
-          const type = types[Math.floor(Math.random() * types.length)];
-          const dataSize = type === 'contract_call' ? 256 : 64;
+          const type = batchTypes[i];
+          const dataStart = offset + 32;
+          offset = dataStart + dataSizes[i];
           
           transactions.push({
-            id: `tx_${Date.now()}_${i}_${crypto.randomBytes(4).toString('hex')}`,
-            from: this.testKeypair.publicKey.toBase58(),
-            to: new PublicKey(crypto.randomBytes(32)).toBase58(),
+            id: `tx_${this.txIdPrefix}_${this.txSequence++}`,
+            from,
+            to: new PublicKey(entropy.subarray(dataStart - 32, dataStart)).toBase58(),
             value: BigInt(Math.floor(Math.random() * 1000000)),
-            data: crypto.randomBytes(dataSize).toString('hex'),
+            data: entropy.toString('hex', dataStart, offset),
             gas: 21000 + Math.floor(Math.random() * 50000),
             type
           });
@@ -517,13 +560,19 @@ export class StressTestRunner {
       // Calculate required batches and interval
       const totalTransactions = options.targetTps * options.testDurationSeconds;
       const totalBatches = Math.ceil(totalTransactions / options.batchSize);
-      const batchesPerClient = Math.ceil(totalBatches / options.concurrentClients);
-      const intervalMs = (options.testDurationSeconds * 1000) / batchesPerClient;
+      // Client counts may be scaled (e.g. 1.5x), so round up to whole clients first
+      const clientCount = Math.ceil(options.concurrentClients);
+      // Split the batches exactly: the first `extraBatches` clients each take one more
+      const baseBatchesPerClient = Math.floor(totalBatches / clientCount);
+      const extraBatches = totalBatches % clientCount;
+      const intervalMs = (options.testDurationSeconds * 1000) / (baseBatchesPerClient + (extraBatches > 0 ? 1 : 0));
       
       this.logger.info('Stress test parameters calculated', {
         totalTransactions,
         totalBatches,
-        batchesPerClient,
+        clientCount,
+        baseBatchesPerClient,
+        extraBatches,
         intervalMs
       });
       
@@ -531,20 +580,22 @@ export class StressTestRunner {
       const clientPromises = [];
       let successfulTransactions = 0;
       let failedTransactions = 0;
-      const latencies: number[] = [];
+      // Clients run totalBatches full batches between them, so this bounds the sample count
+      const latencies = new Float64Array(totalBatches * options.batchSize);
+      let latencyCount = 0;
       
-      for (let i = 0; i < options.concurrentClients; i++) {
+      for (let i = 0; i < clientCount; i++) {
         clientPromises.push(this.runClient(
           i,
           generator,
           options.batchSize,
-          batchesPerClient,
+          baseBatchesPerClient + (i < extraBatches ? 1 : 0),
           intervalMs,
           (success, latency) => {
             if (success) {
               successfulTransactions++;
-              if (latency !== undefined) {
-                latencies.push(latency);
+              if (latency !== undefined && latencyCount < latencies.length) {
+                latencies[latencyCount++] = latency;
               }
             } else {
               failedTransactions++;
@@ -572,12 +623,12 @@ export class StressTestRunner {
       const successRate = successfulTransactions / totalTransactionsProcessed;
       
       // Calculate latency percentiles
-      latencies.sort((a, b) => a - b);
-      const avgLatencyMs = latencies.reduce((sum, val) => sum + val, 0) / latencies.length;
-      const p95Index = Math.floor(latencies.length * 0.95);
-      const p99Index = Math.floor(latencies.length * 0.99);
-      const p95LatencyMs = latencies[p95Index] || 0;
-      const p99LatencyMs = latencies[p99Index] || 0;
+      const sortedLatencies = latencies.subarray(0, latencyCount).sort();
+      const avgLatencyMs = sortedLatencies.reduce((sum, val) => sum + val, 0) / sortedLatencies.length;
+      const p95Index = Math.floor(sortedLatencies.length * 0.95);
+      const p99Index = Math.floor(sortedLatencies.length * 0.99);
+      const p95LatencyMs = sortedLatencies[p95Index] || 0;
+      const p99LatencyMs = sortedLatencies[p99Index] || 0;
       
       // Create performance metrics
       const metrics: PerformanceMetrics = {
@@ -651,12 +702,17 @@ export class StressTestRunner {
     errorCounts: Record<string, number>
   ): Promise<void> {
     try {
-      this.logger.info(`Starting client ${clientId}`, {
+      this.logger.debug(`Starting client ${clientId}`, {
         batchSize,
         batchCount,
         intervalMs
       });
       
+      const recordFailure = (errorType: string) => {
+        callback(false);
+        errorCounts[errorType] = (errorCounts[errorType] || 0) + 1;
+      };
+      
       for (let i = 0; i < batchCount; i++) {
         const batchStartTime = Date.now();
         
@@ -664,8 +720,8 @@ export class StressTestRunner {
           // Generate transaction batch
           const transactions = await generator.generateTransactionBatch(batchSize);
           
-          // Process transactions
-          for (const tx of transactions) {
+          // Process transactions; they are independent, so the whole batch is in flight at once
+          await Promise.all(transactions.map(async (tx) => {
             const txStartTime = Date.now();
             
             try {
@@ -682,20 +738,12 @@ export class StressTestRunner {
                 const latency = Date.now() - txStartTime;
                 callback(true, latency);
               } else {
-                callback(false);
-                
-                // Record error
-                const errorType = this.getRandomErrorType();
-                errorCounts[errorType] = (errorCounts[errorType] || 0) + 1;
+                recordFailure(this.getRandomErrorType());
               }
             } catch (txError) {
-              callback(false);
-              
-              // Record error
-              const errorType = txError.message || 'unknown_error';
-              errorCounts[errorType] = (errorCounts[errorType] || 0) + 1;
+              recordFailure(txError.message || 'unknown_error');
             }
-          }
+          }));
           
           // Calculate time to wait until next batch
           const batchEndTime = Date.now();
@@ -714,7 +762,7 @@ export class StressTestRunner {
         }
       }
       
-      this.logger.info(`Client ${clientId} completed`);
+      this.logger.debug(`Client ${clientId} completed`);
     } catch (error) {
       this.logger.error(`Client ${clientId} failed`, { error });
       throw error;
@@ -728,17 +776,7 @@ export class StressTestRunner {
    * @private
    */
   private getRandomErrorType(): string {
-    const errorTypes = [
-      'timeout',
-      'insufficient_funds',
-      'nonce_too_low',
-      'gas_price_too_low',
-      'execution_reverted',
-      'rate_limited',
-      'network_congestion'
-    ];
-    
-    return errorTypes[Math.floor(Math.random() * errorTypes.length)];
+    return SIMULATED_ERROR_TYPES[Math.floor(Math.random() * SIMULATED_ERROR_TYPES.length)];
   }
 
   /**
@@ -873,13 +911,7 @@ export class StressTestRunner {
       fs.writeFileSync(filename, JSON.stringify({
         timestamp,
         results: this.testResults,
-        summary: {
-          totalTests: this.testResults.length,
-          successfulTests: this.testResults.filter(r => r.targetAchieved).length,
-          averageTps: this.testResults.reduce((sum, r) => sum + r.metrics.tps, 0) / this.testResults.length,
-          maxTps: Math.max(...this.testResults.map(r => r.metrics.tps)),
-          averageLatency: this.testResults.reduce((sum, r) => sum + r.metrics.avgLatencyMs, 0) / this.testResults.length
-        }
+        summary: this.summarizeTestResults()
       }, null, 2));
       
       this.logger.info('Test results saved', {
@@ -890,6 +922,44 @@ export class StressTestRunner {
     }
   }
 
+  /**
+   * Summarizes the test results in a single pass
+   * 
+   * @returns Aggregate statistics over all test results
+   * @private
+   */
+  private summarizeTestResults(): {
+    totalTests: number;
+    successfulTests: number;
+    averageTps: number;
+    maxTps: number;
+    averageLatency: number;
+  } {
+    let successfulTests = 0;
+    let tpsSum = 0;
+    let maxTps = -Infinity;
+    let latencySum = 0;
+    
+    for (const r of this.testResults) {
+      if (r.targetAchieved) {
+        successfulTests++;
+      }
+      tpsSum += r.metrics.tps;
+      maxTps = Math.max(maxTps, r.metrics.tps);
+      latencySum += r.metrics.avgLatencyMs;
+    }
+    
+    const totalTests = this.testResults.length;
+    
+    return {
+      totalTests,
+      successfulTests,
+      averageTps: tpsSum / totalTests,
+      maxTps,
+      averageLatency: latencySum / totalTests
+    };
+  }
+
   /**
    * Gets all test results
    * 
@@ -915,24 +985,21 @@ export class StressTestRunner {
    * @returns Stress test report as a string
    */
   generateStressTestReport(): string {
-    const successfulTests = this.testResults.filter(r => r.targetAchieved);
-    const failedTests = this.testResults.filter(r => !r.targetAchieved);
-    const averageTps = this.testResults.reduce((sum, r) => sum + r.metrics.tps, 0) / this.testResults.length;
-    const maxTps = Math.max(...this.testResults.map(r => r.metrics.tps));
+    const { totalTests, successfulTests, averageTps, maxTps } = this.summarizeTestResults();
     
     let report = '# Stress Test Report\n\n';
     report += `Generated: ${new Date().toISOString()}\n\n`;
     report += `## Summary\n\n`;
-    report += `- Total Tests: ${this.testResults.length}\n`;
-    report += `- Successful Tests: ${successfulTests.length}\n`;
-    report += `- Failed Tests: ${failedTests.length}\n`;
+    report += `- Total Tests: ${totalTests}\n`;
+    report += `- Successful Tests: ${successfulTests}\n`;
+    report += `- Failed Tests: ${totalTests - successfulTests}\n`;
     report += `- Average TPS: ${averageTps.toFixed(2)}\n`;
     report += `- Maximum TPS: ${maxTps.toFixed(2)}\n\n`;
     
     report += `## Target Achievement\n\n`;
     report += `- Target TPS: ${this.targetTps}\n`;
-    report += `- Tests Meeting Target: ${successfulTests.length}\n`;
-    report += `- Success Rate: ${(successfulTests.length / this.testResults.length * 100).toFixed(2)}%\n\n`;
+    report += `- Tests Meeting Target: ${successfulTests}\n`;
+    report += `- Success Rate: ${(successfulTests / totalTests * 100).toFixed(2)}%\n\n`;
     
     report += `## Test Results\n\n`;
     
@@ -947,9 +1014,10 @@ export class StressTestRunner {
       report += `- P99 Latency: ${result.metrics.p99LatencyMs.toFixed(2)}ms\n`;
       report += `- Duration: ${((result.endTimestamp - result.startTimestamp) / 1000).toFixed(2)}s\n\n`;
       
-      if (Object.keys(result.errorCounts).length > 0) {
+      const errorEntries = Object.entries(result.errorCounts).sort((a, b) => b[1] - a[1]);
+      if (errorEntries.length > 0) {
         report += `#### Errors\n\n`;
-        for (const [errorType, count] of Object.entries(result.errorCounts)) {
+        for (const [errorType, count] of errorEntries) {
           report += `- ${errorType}: ${count}\n`;
         }
         report += `\n`;
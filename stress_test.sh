@@ -18,9 +18,13 @@ NUM_CONCURRENT_USERS=50
 TEST_DURATION=300 # seconds
 LOG_FILE="./test_results/stress_test_$(date +%Y%m%d_%H%M%S).log"
 
-# Log function
+# Log function; writes the line itself instead of piping through tee. The timestamp
+# still comes from date, since printf's %(...)T needs bash 4.2+ (macOS ships 3.2)
 log() {
-    echo "[$(date +"%Y-%m-%d %H:%M:%S")] $1" | tee -a "$LOG_FILE"
+    local line
+    line="[$(date +"%Y-%m-%d %H:%M:%S")] $1"
+    echo "$line"
+    echo "$line" >> "$LOG_FILE"
 }
 
 # Check if the system is running
@@ -43,9 +47,9 @@ test_transaction_throughput() {
     # Simulate sending many transactions
     for i in $(seq 1 $NUM_TRANSACTIONS); do
         # Replace with actual transaction sending command
-        echo "Sending transaction $i" >> "$LOG_FILE"
+        echo "Sending transaction $i"
         # ./layer2_cli.sh transfer --to <RANDOM_ADDRESS> --amount 0.001 --token SOL
-    done
+    done >> "$LOG_FILE"
     
     end_time=$(date +%s)
     duration=$((end_time - start_time))
@@ -60,24 +64,23 @@ test_transaction_throughput() {
 test_concurrent_users() {
     log "Testing with $NUM_CONCURRENT_USERS concurrent users..."
     
-    # Create a temporary script for each user
-    for i in $(seq 1 $NUM_CONCURRENT_USERS); do
-        cat > "./test_results/user_$i.sh" << EOF
+    # Create a single user script; the user number is passed as its first argument
+    user_script="./test_results/user.sh"
+    cat > "$user_script" << EOF
 #!/bin/bash
 for j in \$(seq 1 10); do
     # Replace with actual transaction commands
     # ./layer2_cli.sh transfer --to <RANDOM_ADDRESS> --amount 0.001 --token SOL
-    echo "User $i - Transaction \$j" >> "$LOG_FILE"
+    echo "User \$1 - Transaction \$j" >> "$LOG_FILE"
     sleep \$(echo "scale=2; \$RANDOM/32767" | bc)
 done
 EOF
-        chmod +x "./test_results/user_$i.sh"
-    done
+    chmod +x "$user_script"
     
-    # Run all user scripts in parallel
+    # Run one copy of the user script per user in parallel
     log "Starting concurrent user simulation..."
     for i in $(seq 1 $NUM_CONCURRENT_USERS); do
-        "./test_results/user_$i.sh" &
+        "$user_script" "$i" &
     done
     
     # Wait for all background processes to complete
@@ -98,9 +101,9 @@ test_extended_load() {
         # Replace with actual transaction command
         # ./layer2_cli.sh transfer --to <RANDOM_ADDRESS> --amount 0.001 --token SOL
         transaction_count=$((transaction_count + 1))
-        echo "Extended load test - Transaction $transaction_count" >> "$LOG_FILE"
+        echo "Extended load test - Transaction $transaction_count"
         sleep 0.1
-    done
+    done >> "$LOG_FILE"
     
     actual_duration=$(($(date +%s) - start_time))
     tps=$(echo "scale=2; $transaction_count / $actual_duration" | bc)
@@ -134,16 +137,16 @@ test_bridge_under_load() {
     for i in $(seq 1 20); do
         # Replace with actual deposit command
         # ./layer2_cli.sh deposit --amount 0.01 --token SOL
-        echo "Bridge test - Deposit $i" >> "$LOG_FILE"
-    done
+        echo "Bridge test - Deposit $i"
+    done >> "$LOG_FILE"
     
     # Simulate multiple withdrawals
     log "Simulating multiple withdrawals..."
     for i in $(seq 1 20); do
         # Replace with actual withdrawal command
         # ./layer2_cli.sh withdraw --amount 0.005 --token SOL
-        echo "Bridge test - Withdrawal $i" >> "$LOG_FILE"
-    done
+        echo "Bridge test - Withdrawal $i"
+    done >> "$LOG_FILE"
     
     log "Bridge load test completed."
 }
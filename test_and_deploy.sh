@@ -6,7 +6,11 @@
 # Set environment variables
 export NODE_ENV=test
 export SOLANA_RPC_URL="https://api.devnet.solana.com"
-export LAYER2_RPC_URL="http://localhost:8899"
+export LAYER2_RPC_URL="http://127.0.0.1:8899"
+
+# Set SMOKE=1 to run only the critical test stages (skips stress, frontend,
+# mobile, benchmarks and coverage)
+SMOKE=${SMOKE:-0}
 
 # Text colors
 GREEN='\033[0;32m'
@@ -15,10 +19,13 @@ YELLOW='\033[0;33m'
 BLUE='\033[0;34m'
 NC='\033[0m' # No Color
 
+# Banner rule shared by the header and the deployment summary
+BANNER_RULE="========================================================="
+
 # Print header
-echo -e "${BLUE}=========================================================${NC}"
+echo -e "${BLUE}${BANNER_RULE}${NC}"
 echo -e "${BLUE}   Layer-2 on Solana - Testing and Deployment Script     ${NC}"
-echo -e "${BLUE}=========================================================${NC}"
+echo -e "${BLUE}${BANNER_RULE}${NC}"
 
 # Function to check if a command was successful
 check_status() {
@@ -33,27 +40,41 @@ check_status() {
   fi
 }
 
+# Function to wait until a local port accepts connections (default timeout: 30s)
+wait_for_port() {
+  local port=$1
+  local attempts=$(( ${2:-30} * 5 ))
+  until (exec 3<>/dev/tcp/127.0.0.1/$port) 2>/dev/null; do
+    attempts=$((attempts - 1))
+    if [ $attempts -le 0 ]; then
+      return 1
+    fi
+    sleep 0.2
+  done
+}
+
 # Function to run a test and report results
 run_test() {
   local test_name=$1
   local test_command=$2
   local criticality=$3
   
+  if [ "$SMOKE" == "1" ] && [ "$criticality" != "critical" ]; then
+    echo -e "\n${YELLOW}Skipping test (smoke mode): ${test_name}${NC}"
+    return
+  fi
+  
   echo -e "\n${YELLOW}Running test: ${test_name}${NC}"
   eval $test_command
   
   check_status $criticality
 }
 
-# Start local Solana validator for testing
+# Start local Solana validator for testing; it boots while dependencies install and build
 echo -e "\n${YELLOW}Starting local Solana validator...${NC}"
 solana-test-validator --reset --quiet &
 VALIDATOR_PID=$!
 
-# Wait for validator to start
-echo "Waiting for validator to start..."
-sleep 5
-
 # Install dependencies
 echo -e "\n${YELLOW}Installing dependencies...${NC}"
 npm install
@@ -64,6 +85,11 @@ echo -e "\n${YELLOW}Building the project...${NC}"
 npm run build
 check_status "critical"
 
+# Wait for validator RPC to accept connections before any test needs it
+echo "Waiting for validator to start..."
+wait_for_port 8899
+check_status "critical"
+
 # Run unit tests
 run_test "Unit Tests" "npm run test:unit" "critical"
 
@@ -91,15 +117,17 @@ run_test "Frontend Tests" "cd frontend && npm test" "non-critical"
 # Run mobile tests
 run_test "Mobile Tests" "cd mobile && npm test" "non-critical"
 
-# Run performance benchmarks
-echo -e "\n${YELLOW}Running performance benchmarks...${NC}"
-npm run benchmark
-check_status "non-critical"
-
-# Generate test coverage report
-echo -e "\n${YELLOW}Generating test coverage report...${NC}"
-npm run coverage
-check_status "non-critical"
+if [ "$SMOKE" != "1" ]; then
+  # Run performance benchmarks
+  echo -e "\n${YELLOW}Running performance benchmarks...${NC}"
+  npm run benchmark
+  check_status "non-critical"
+  
+  # Generate test coverage report
+  echo -e "\n${YELLOW}Generating test coverage report...${NC}"
+  npm run coverage
+  check_status "non-critical"
+fi
 
 # Stop the local validator
 echo -e "\n${YELLOW}Stopping local Solana validator...${NC}"
@@ -155,9 +183,9 @@ npm run verify:deployment -- --network $NETWORK
 check_status "critical"
 
 # Print deployment information
-echo -e "\n${GREEN}=========================================================${NC}"
+echo -e "\n${GREEN}${BANNER_RULE}${NC}"
 echo -e "${GREEN}   Layer-2 on Solana - Deployment Successful!           ${NC}"
-echo -e "${GREEN}=========================================================${NC}"
+echo -e "${GREEN}${BANNER_RULE}${NC}"
 echo -e "${YELLOW}Network:${NC} $NETWORK"
 echo -e "${YELLOW}Frontend URL:${NC} https://layer2-solana.com"
 echo -e "${YELLOW}API URL:${NC} https://api.layer2-solana.com"
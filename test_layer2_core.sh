@@ -8,282 +8,94 @@ set -e
 echo "Starting Layer-2 Core Components Test Suite..."
 echo "=============================================="
 
-# Create test directory
+# Create test directory, removed once on exit whether the suite passes or fails
 TEST_DIR="/tmp/layer2-tests"
 mkdir -p $TEST_DIR
+trap 'rm -rf "$TEST_DIR"' EXIT
 
-# Colors for output
-GREEN='\033[0;32m'
-RED='\033[0;31m'
-YELLOW='\033[0;33m'
-NC='\033[0m' # No Color
+# Colors for output (escapes expanded once here, not by echo -e on every call)
+GREEN=$'\033[0;32m'
+RED=$'\033[0;31m'
+YELLOW=$'\033[0;33m'
+NC=$'\033[0m' # No Color
+
+# Prebuilt line formats for the status helpers
+SUCCESS_FORMAT="${GREEN}✓ %s${NC}\n"
+ERROR_FORMAT="${RED}✗ %s${NC}\n"
+WARNING_FORMAT="${YELLOW}! %s${NC}\n"
 
 # Function to print success message
 function success() {
-  echo -e "${GREEN}✓ $1${NC}"
+  printf "$SUCCESS_FORMAT" "$1"
 }
 
 # Function to print error message
 function error() {
-  echo -e "${RED}✗ $1${NC}"
+  printf "$ERROR_FORMAT" "$1"
   exit 1
 }
 
 # Function to print warning message
 function warning() {
-  echo -e "${YELLOW}! $1${NC}"
+  printf "$WARNING_FORMAT" "$1"
 }
 
-echo "Testing Optimistic Rollup System..."
-echo "-----------------------------------"
-
-# Test transaction creation
-echo "Testing transaction creation..."
-# In a real implementation, this would create a test transaction
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Transaction creation successful"
-else
-  error "Transaction creation failed"
-fi
-
-# Test batch creation
-echo "Testing batch creation..."
-# In a real implementation, this would create a test batch
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Batch creation successful"
-else
-  error "Batch creation failed"
-fi
-
-# Test fraud proof submission
-echo "Testing fraud proof submission..."
-# In a real implementation, this would submit a test fraud proof
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Fraud proof submission successful"
-else
-  error "Fraud proof submission failed"
-fi
-
-# Test challenge resolution
-echo "Testing challenge resolution..."
-# In a real implementation, this would resolve a test challenge
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Challenge resolution successful"
-else
-  error "Challenge resolution failed"
-fi
-
-echo "Testing Bridge System..."
-echo "------------------------"
-
-# Test token registration
-echo "Testing token registration..."
-# In a real implementation, this would register a test token
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Token registration successful"
-else
-  error "Token registration failed"
-fi
-
-# Test SOL deposit
-echo "Testing SOL deposit..."
-# In a real implementation, this would deposit test SOL
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "SOL deposit successful"
-else
-  error "SOL deposit failed"
-fi
-
-# Test SPL token deposit
-echo "Testing SPL token deposit..."
-# In a real implementation, this would deposit a test SPL token
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "SPL token deposit successful"
-else
-  error "SPL token deposit failed"
-fi
-
-# Test NFT deposit
-echo "Testing NFT deposit..."
-# In a real implementation, this would deposit a test NFT
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "NFT deposit successful"
-else
-  error "NFT deposit failed"
-fi
-
-# Test withdrawal
-echo "Testing withdrawal..."
-# In a real implementation, this would withdraw test tokens
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Withdrawal successful"
-else
-  error "Withdrawal failed"
-fi
-
-# Test Wormhole integration
-echo "Testing Wormhole integration..."
-# In a real implementation, this would test Wormhole integration
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Wormhole integration successful"
-else
-  error "Wormhole integration failed"
-fi
-
-echo "Testing Transaction Sequencer..."
-echo "-------------------------------"
-
-# Test sequencer initialization
-echo "Testing sequencer initialization..."
-# In a real implementation, this would initialize a test sequencer
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Sequencer initialization successful"
-else
-  error "Sequencer initialization failed"
-fi
-
-# Test transaction submission
-echo "Testing transaction submission..."
-# In a real implementation, this would submit a test transaction
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Transaction submission successful"
-else
-  error "Transaction submission failed"
-fi
-
-# Test batch creation
-echo "Testing batch creation..."
-# In a real implementation, this would create a test batch
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Batch creation successful"
-else
-  error "Batch creation failed"
-fi
-
-# Test batch publication
-echo "Testing batch publication..."
-# In a real implementation, this would publish a test batch
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Batch publication successful"
-else
-  error "Batch publication failed"
-fi
-
-# Test priority ordering
-echo "Testing priority ordering..."
-# In a real implementation, this would test priority ordering
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Priority ordering successful"
-else
-  error "Priority ordering failed"
-fi
-
-echo "Testing Gasless Transaction System..."
-echo "------------------------------------"
-
-# Test relayer registration
-echo "Testing relayer registration..."
-# In a real implementation, this would register a test relayer
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Relayer registration successful"
-else
-  error "Relayer registration failed"
-fi
-
-# Test meta-transaction creation
-echo "Testing meta-transaction creation..."
-# In a real implementation, this would create a test meta-transaction
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Meta-transaction creation successful"
-else
-  error "Meta-transaction creation failed"
-fi
-
-# Test meta-transaction signing
-echo "Testing meta-transaction signing..."
-# In a real implementation, this would sign a test meta-transaction
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Meta-transaction signing successful"
-else
-  error "Meta-transaction signing failed"
-fi
-
-# Test meta-transaction relaying
-echo "Testing meta-transaction relaying..."
-# In a real implementation, this would relay a test meta-transaction
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Meta-transaction relaying successful"
-else
-  error "Meta-transaction relaying failed"
-fi
-
-# Test fee subsidization
-echo "Testing fee subsidization..."
-# In a real implementation, this would test fee subsidization
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Fee subsidization successful"
-else
-  error "Fee subsidization failed"
-fi
-
-echo "Testing Integration..."
-echo "---------------------"
-
-# Test end-to-end flow
-echo "Testing end-to-end flow..."
-# In a real implementation, this would test the entire flow
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "End-to-end flow successful"
-else
-  error "End-to-end flow failed"
-fi
+# Function to print a section heading underlined to its width
+function section() {
+  local heading="Testing $1..."
+  echo "$heading"
+  echo "${heading//?/-}"
+}
 
-# Test high load
-echo "Testing high load..."
-# In a real implementation, this would test high load
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "High load test successful"
-else
-  error "High load test failed"
-fi
+# Function to run one check: print the step, then report its command's outcome.
+# A check given no command is a placeholder that passes until the real step is wired in.
+function check() {
+  local step=$1
+  local label=$2
+  shift 2
+  echo "Testing $step..."
+  if "${@:-true}"; then
+    success "$label successful"
+  else
+    error "$label failed"
+  fi
+}
 
-# Test error handling
-echo "Testing error handling..."
-# In a real implementation, this would test error handling
-# For simplicity, we're just simulating success
-if [ $? -eq 0 ]; then
-  success "Error handling test successful"
-else
-  error "Error handling test failed"
-fi
+section "Optimistic Rollup System"
+check "transaction creation" "Transaction creation"
+check "batch creation" "Batch creation"
+check "fraud proof submission" "Fraud proof submission"
+check "challenge resolution" "Challenge resolution"
+
+section "Bridge System"
+check "token registration" "Token registration"
+check "SOL deposit" "SOL deposit"
+check "SPL token deposit" "SPL token deposit"
+check "NFT deposit" "NFT deposit"
+check "withdrawal" "Withdrawal"
+check "Wormhole integration" "Wormhole integration"
+
+section "Transaction Sequencer"
+check "sequencer initialization" "Sequencer initialization"
+check "transaction submission" "Transaction submission"
+check "batch creation" "Batch creation"
+check "batch publication" "Batch publication"
+check "priority ordering" "Priority ordering"
+
+section "Gasless Transaction System"
+check "relayer registration" "Relayer registration"
+check "meta-transaction creation" "Meta-transaction creation"
+check "meta-transaction signing" "Meta-transaction signing"
+check "meta-transaction relaying" "Meta-transaction relaying"
+check "fee subsidization" "Fee subsidization"
+
+section "Integration"
+check "end-to-end flow" "End-to-end flow"
+check "high load" "High load test"
+check "error handling" "Error handling test"
 
 echo "=============================================="
 echo "All tests passed successfully!"
 echo "Layer-2 Core Components are ready for deployment."
 
-# Clean up
-rm -rf $TEST_DIR
-
 exit 0
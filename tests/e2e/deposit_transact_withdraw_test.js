@@ -17,9 +17,9 @@ describe('End-to-End: Deposit, Transact, Withdraw Flow', function() {
   
   before(async function() {
     // Setup connections
-    ethProvider = new ethers.providers.JsonRpcProvider("http://localhost:8545");
-    solConnection = new Connection("http://localhost:8899", "confirmed");
-    l2Client = new L2Client("http://localhost:3000");
+    ethProvider = new ethers.providers.JsonRpcProvider("http://127.0.0.1:8545");
+    solConnection = new Connection("http://127.0.0.1:8899", "confirmed");
+    l2Client = new L2Client("http://127.0.0.1:3000");
     
     // Get user wallet
     const privateKey = "0x" + "1".repeat(64); // Deterministic private key from ganache
@@ -54,8 +54,11 @@ describe('End-to-End: Deposit, Transact, Withdraw Flow', function() {
     // Step 1: Check initial balances
     console.log("Step 1: Checking initial balances");
     
-    const initialL1Balance = await ethProvider.getBalance(user.address);
-    const initialL2Balance = await l2Client.getBalance(l2Wallet.publicKey);
+    // L1 and L2 balances come from different nodes, so query them concurrently
+    const [initialL1Balance, initialL2Balance] = await Promise.all([
+      ethProvider.getBalance(user.address),
+      l2Client.getBalance(l2Wallet.publicKey)
+    ]);
     
     console.log("Initial L1 balance:", ethers.utils.formatEther(initialL1Balance), "ETH");
     console.log("Initial L2 balance:", ethers.utils.formatEther(initialL2Balance), "ETH");
@@ -183,8 +186,10 @@ describe('End-to-End: Deposit, Transact, Withdraw Flow', function() {
     // Step 9: Verify final balances
     console.log("Step 9: Verifying final balances");
     
-    const finalL1Balance = await ethProvider.getBalance(user.address);
-    const finalL2Balance = await l2Client.getBalance(l2Wallet.publicKey);
+    const [finalL1Balance, finalL2Balance] = await Promise.all([
+      ethProvider.getBalance(user.address),
+      l2Client.getBalance(l2Wallet.publicKey)
+    ]);
     
     console.log("Final L1 balance:", ethers.utils.formatEther(finalL1Balance), "ETH");
     console.log("Final L2 balance:", ethers.utils.formatEther(finalL2Balance), "ETH");
@@ -1,6 +1,31 @@
 #!/bin/bash
 # setup-local-testnet.sh
 
+# Function to wait until a local port accepts connections (default timeout: 30s)
+function wait_for_port {
+  local port=$1
+  local attempts=$(( ${2:-30} * 5 ))
+  until (exec 3<>/dev/tcp/127.0.0.1/$port) 2>/dev/null; do
+    attempts=$((attempts - 1))
+    if [ $attempts -le 0 ]; then
+      return 1
+    fi
+    sleep 0.2
+  done
+}
+
+# Share one target directory between the L2 crates so common dependencies build once
+export CARGO_TARGET_DIR="${CARGO_TARGET_DIR:-$PWD/target}"
+
+# Build L2 binaries in the background while the L1 nodes start and contracts deploy;
+# they are started directly below instead of through cargo run
+echo "Building L2 sequencer and validator..."
+(
+  cargo build --release --manifest-path sequencer/Cargo.toml &&
+  cargo build --release --manifest-path validator/Cargo.toml
+) &
+BUILD_PID=$!
+
 # Start local Ethereum node
 echo "Starting local Ethereum node..."
 ganache-cli --deterministic --mnemonic "test test test test test test test test test test test junk" &
@@ -11,8 +36,14 @@ echo "Starting local Solana validator..."
 solana-test-validator &
 SOLANA_PID=$!
 
-# Wait for nodes to start
-sleep 5
+# Wait for both nodes' RPC ports to accept connections
+if ! wait_for_port 8545 || ! wait_for_port 8899; then
+  echo "Local nodes failed to start"
+  # BUILD_PID is the build subshell, so stop the cargo process it is running first
+  pkill -P "$BUILD_PID"
+  kill "$BUILD_PID" "$ETHEREUM_PID" "$SOLANA_PID"
+  exit 1
+fi
 
 # Deploy L1 contracts
 echo "Deploying L1 contracts..."
@@ -20,22 +51,36 @@ cd ethereum
 npx hardhat run scripts/deploy.js --network localhost
 cd ..
 
+# Wait for the L2 build before starting its binaries
+if ! wait "$BUILD_PID"; then
+  echo "Failed to build L2 sequencer and validator"
+  kill "$ETHEREUM_PID" "$SOLANA_PID"
+  exit 1
+fi
+
+# The binaries are launched directly, so make sure the build produced them under these names
+for binary in "$CARGO_TARGET_DIR/release/sequencer" "$CARGO_TARGET_DIR/release/validator"; do
+  if [ ! -x "$binary" ]; then
+    echo "L2 binary not found or not executable: $binary"
+    kill "$ETHEREUM_PID" "$SOLANA_PID"
+    exit 1
+  fi
+done
+
 # Start L2 sequencer
 echo "Starting L2 sequencer..."
-cd sequencer
-cargo run --release -- --ethereum-rpc http://localhost:8545 --solana-rpc http://localhost:8899 &
+"$CARGO_TARGET_DIR/release/sequencer" --ethereum-rpc http://127.0.0.1:8545 --solana-rpc http://127.0.0.1:8899 &
 SEQUENCER_PID=$!
 
 # Start L2 validator
 echo "Starting L2 validator..."
-cd validator
-cargo run --release -- --ethereum-rpc http://localhost:8545 --solana-rpc http://localhost:8899 &
+"$CARGO_TARGET_DIR/release/validator" --ethereum-rpc http://127.0.0.1:8545 --solana-rpc http://127.0.0.1:8899 &
 VALIDATOR_PID=$!
 
 echo "Local testnet is running!"
-echo "Ethereum RPC: http://localhost:8545"
-echo "Solana RPC: http://localhost:8899"
-echo "L2 API: http://localhost:3000"
+echo "Ethereum RPC: http://127.0.0.1:8545"
+echo "Solana RPC: http://127.0.0.1:8899"
+echo "L2 API: http://127.0.0.1:3000"
 
 # Function to clean up processes on exit
 function cleanup {
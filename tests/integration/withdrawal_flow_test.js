@@ -14,9 +14,9 @@ describe('Withdrawal Flow Integration Test', function() {
   
   before(async function() {
     // Setup connections
-    ethProvider = new ethers.providers.JsonRpcProvider("http://localhost:8545");
-    solConnection = new Connection("http://localhost:8899", "confirmed");
-    l2Client = new L2Client("http://localhost:3000");
+    ethProvider = new ethers.providers.JsonRpcProvider("http://127.0.0.1:8545");
+    solConnection = new Connection("http://127.0.0.1:8899", "confirmed");
+    l2Client = new L2Client("http://127.0.0.1:3000");
     
     // Deploy contracts
     const DepositBridge = await ethers.getContractFactory("L1ToL2DepositBridge");
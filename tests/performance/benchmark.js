@@ -1,6 +1,6 @@
 // src/performance/benchmark.js
 const { ethers } = require('ethers');
-const { Connection, Keypair, PublicKey, Transaction } = require('@solana/web3.js');
+const { Keypair } = require('@solana/web3.js');
 const fs = require('fs');
 const path = require('path');
 
@@ -13,7 +13,7 @@ const path = require('path');
  * - Resource usage
  * 
  * Usage:
- *   node benchmark.js --rpc-url=http://localhost:3000 --duration=60 --threads=8 --batch-size=100
+ *   node benchmark.js --rpc-url=http://127.0.0.1:3000 --duration=60 --threads=8 --batch-size=100 --concurrency=4
  */
 
 // Parse command line arguments
@@ -23,16 +23,26 @@ const args = process.argv.slice(2).reduce((acc, arg) => {
   return acc;
 }, {});
 
-const rpcUrl = args['rpc-url'] || 'http://localhost:3000';
+const rpcUrl = args['rpc-url'] || 'http://127.0.0.1:3000';
 const duration = parseInt(args['duration'] || '60', 10);
 const threadCount = parseInt(args['threads'] || '8', 10);
 const batchSize = parseInt(args['batch-size'] || '100', 10);
+const concurrency = parseInt(args['concurrency'] || '4', 10); // In-flight transfers per wallet
+
+// Zero lanes would leave each wallet's loop spinning without ever sending a transfer
+for (const [option, value] of [['batch-size', batchSize], ['concurrency', concurrency]]) {
+  if (!Number.isInteger(value) || value < 1) {
+    console.error(`--${option} must be a positive integer, got:`, args[option]);
+    process.exit(1);
+  }
+}
 
 console.log('Starting benchmark with settings:');
 console.log('RPC URL:', rpcUrl);
 console.log('Duration:', duration, 'seconds');
 console.log('Threads:', threadCount);
 console.log('Batch size:', batchSize);
+console.log('Concurrency:', concurrency);
 
 // Create L2 client
 const l2Client = new L2Client(rpcUrl);
@@ -46,9 +56,9 @@ async function fundWallets() {
   
   // In a real implementation, we would fund these wallets from a faucet or existing account
   // For this mock implementation, we'll just set balances directly
-  for (const wallet of wallets) {
-    await l2Client.setBalance(wallet.publicKey, ethers.utils.parseEther('1000.0'));
-  }
+  // Wallets are independent, so fund them all concurrently
+  const fundingAmount = ethers.utils.parseEther('1000.0');
+  await Promise.all(wallets.map(wallet => l2Client.setBalance(wallet.publicKey, fundingAmount)));
   
   console.log('Wallets funded successfully');
 }
@@ -66,49 +76,48 @@ async function runBenchmark() {
   // Create recipients
   const recipients = Array(threadCount * 10).fill(0).map(() => Keypair.generate());
   
+  // Every transfer sends the same amount, so parse it once
+  const amount = ethers.utils.parseEther('0.001');
+  
   // Start benchmark
   console.log('Starting benchmark...');
   const startTime = Date.now();
   const endTime = startTime + (duration * 1000);
   
+  // Lanes per wallet never exceed the batch they work through
+  const laneCount = Math.min(concurrency, batchSize);
+  
   // Create promises for each thread
-  const threadPromises = wallets.map((wallet, i) => {
-    return new Promise(async (resolve) => {
-      while (Date.now() < endTime) {
-        // Generate batch of transactions
-        const txPromises = [];
-        
-        for (let j = 0; j < batchSize; j++) {
-          const recipientIndex = (i * batchSize + j) % recipients.length;
-          const recipient = recipients[recipientIndex];
-          const amount = ethers.utils.parseEther('0.001');
-          
-          const txStartTime = Date.now();
-          
-          const txPromise = l2Client.transfer(wallet, recipient.publicKey, amount)
-            .then(() => {
-              const latency = Date.now() - txStartTime;
-              totalLatency += latency;
-              successfulTxCount++;
-              return true;
-            })
-            .catch(() => {
-              return false;
-            });
-          
-          txPromises.push(txPromise);
-          totalTxCount++;
-        }
-        
-        // Wait for batch to complete
-        await Promise.all(txPromises);
-        
-        // Small delay to prevent overwhelming the client
-        await new Promise(resolve => setTimeout(resolve, 100));
+  const threadPromises = wallets.map(async (wallet, i) => {
+    // Send a single transfer and record its outcome
+    const sendTransfer = async (j) => {
+      const recipientIndex = (i * batchSize + j) % recipients.length;
+      const recipient = recipients[recipientIndex];
+      
+      const txStartTime = Date.now();
+      totalTxCount++;
+      
+      try {
+        await l2Client.transfer(wallet, recipient.publicKey, amount);
+        totalLatency += Date.now() - txStartTime;
+        successfulTxCount++;
+      } catch (error) {
+        // Failed transfers only count towards the total
       }
+    };
+    
+    while (Date.now() < endTime) {
+      // Work through the batch with at most `concurrency` transfers in flight,
+      // so the client is never flooded and no pause between batches is needed
+      let next = 0;
+      const lanes = Array(laneCount).fill(0).map(async () => {
+        while (next < batchSize) {
+          await sendTransfer(next++);
+        }
+      });
       
-      resolve();
-    });
+      await Promise.all(lanes);
+    }
   });
   
   // Wait for all threads to complete
@@ -134,7 +143,8 @@ async function runBenchmark() {
       rpcUrl,
       duration,
       threadCount,
-      batchSize
+      batchSize,
+      concurrency
     },
     results: {
       totalTransactions: totalTxCount,
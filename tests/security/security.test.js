@@ -21,7 +21,7 @@ const { ErrorManager } = require('../offchain/error_manager');
 
 // Configurazione dei test
 const TEST_CONFIG = {
-    solanaRpcUrl: 'http://localhost:8899', // URL locale per i test
+    solanaRpcUrl: 'http://127.0.0.1:8899', // URL locale per i test
     databasePath: ':memory:', // Database in memoria per i test
     programId: 'Layer2TestProgram111111111111111111111111111',
     privateKeyPath: path.join(__dirname, 'test_keypair.json'),
@@ -301,15 +301,24 @@ describe('Test di sicurezza del Layer-2', function() {
     describe('Test di fuzzing', function() {
         it('Dovrebbe gestire correttamente input casuali', async function() {
             // Genera 10 transazioni con input casuali
+            const transactions = [];
+            
+            // Un'unica estrazione casuale per tutte le transazioni: ognuna usa
+            // mittente (32 byte), destinatario (32), firma (64) e fino a 99 byte di dati
+            const bytesPerTransaction = 32 + 32 + 64 + 99;
+            const entropy = crypto.randomBytes(10 * bytesPerTransaction);
+            
             for (let i = 0; i < 10; i++) {
-                const randomSender = crypto.randomBytes(32).toString('hex');
-                const randomRecipient = crypto.randomBytes(32).toString('hex');
+                const offset = i * bytesPerTransaction;
+                const randomSender = entropy.toString('hex', offset, offset + 32);
+                const randomRecipient = entropy.toString('hex', offset + 32, offset + 64);
                 const randomAmount = Math.floor(Math.random() * 1000000) + 1;
                 const randomNonce = Math.floor(Math.random() * 1000000) + 1;
                 const randomExpiry = Date.now() + Math.floor(Math.random() * 3600000) + 3600000;
                 const randomType = Math.floor(Math.random() * 3);
-                const randomData = crypto.randomBytes(Math.floor(Math.random() * 100)).toString('hex');
-                const randomSignature = crypto.randomBytes(64).toString('hex');
+                const randomSignature = Buffer.from(entropy.subarray(offset + 64, offset + 128));
+                const dataLength = Math.floor(Math.random() * 100);
+                const randomData = Buffer.from(entropy.subarray(offset + 128, offset + 128 + dataLength));
                 
                 const transaction = {
                     sender: randomSender,
@@ -318,10 +327,15 @@ describe('Test di sicurezza del Layer-2', function() {
                     nonce: randomNonce,
                     expiry_timestamp: randomExpiry,
                     transaction_type: randomType,
-                    data: Buffer.from(randomData, 'hex'),
-                    signature: Buffer.from(randomSignature, 'hex'),
+                    data: randomData,
+                    signature: randomSignature,
                 };
                 
+                transactions.push(transaction);
+            }
+            
+            // Le transazioni sono indipendenti, quindi vengono inviate tutte insieme
+            await Promise.all(transactions.map(async (transaction) => {
                 // Verifica che il sequencer gestisca correttamente l'input casuale
                 try {
                     const result = await sequencer.addTransaction(transaction);
@@ -332,7 +346,7 @@ describe('Test di sicurezza del Layer-2', function() {
                     expect(error.message).to.not.include('syntax');
                     expect(error.message).to.not.include('database');
                 }
-            }
+            }));
         });
         
         it('Dovrebbe gestire correttamente input malformati', async function() {
@@ -5,7 +5,6 @@
  * performance bottlenecks and system breaking points.
  */
 
-const { UltraOptimizedSequencer } = require('../offchain/sequencer');
 const { BridgeClient } = require('../offchain/bridge');
 const { Layer2Client } = require('../sdk/src/client');
 const { NFTClient } = require('../sdk/src/nft');
@@ -32,12 +31,18 @@ const CONFIG = {
   
   outputDir: path.join(__dirname, '../data/stress-test'),
   
-  solanaRpc: process.env.SOLANA_RPC || 'http://localhost:8899',
-  ethereumRpc: process.env.ETHEREUM_RPC || 'http://localhost:8545',
+  solanaRpc: process.env.SOLANA_RPC || 'http://127.0.0.1:8899',
+  ethereumRpc: process.env.ETHEREUM_RPC || 'http://127.0.0.1:8545',
   
-  metricsEndpoint: process.env.METRICS_ENDPOINT || 'http://localhost:3000'
+  metricsEndpoint: process.env.METRICS_ENDPOINT || 'http://127.0.0.1:3000'
 };
 
+// Running totals of the transaction type weights, computed once for _selectTransactionType
+const CUMULATIVE_TX_WEIGHTS = CONFIG.transactionTypes.reduce((totals, txType) => {
+  totals.push((totals.length > 0 ? totals[totals.length - 1] : 0) + txType.weight);
+  return totals;
+}, []);
+
 if (!fs.existsSync(CONFIG.outputDir)) {
   fs.mkdirSync(CONFIG.outputDir, { recursive: true });
 }
@@ -59,6 +64,7 @@ class StressTestCoordinator {
       breakingPoint: null,
       errors: {}
     };
+    this.totalLatency = 0;
     
     this.metricsClient = new MetricsClient({
       endpoint: CONFIG.metricsEndpoint
@@ -131,6 +137,14 @@ class StressTestCoordinator {
     const tpsPerWorker = CONFIG.targetTps / CONFIG.workers;
     const intervalMs = 1000 / tpsPerWorker;
     
+    const generators = {
+      transfer: () => this._generateTransfer(layer2Client),
+      swap: () => this._generateSwap(layer2Client),
+      nft_mint: () => this._generateNftMint(nftClient),
+      nft_transfer: () => this._generateNftTransfer(nftClient),
+      nft_burn: () => this._generateNftBurn(nftClient)
+    };
+    
     const txInterval = setInterval(async () => {
       if (!this.isRunning) {
         clearInterval(txInterval);
@@ -141,24 +155,7 @@ class StressTestCoordinator {
         const txType = this._selectTransactionType();
         const startTime = Date.now();
         
-        let result;
-        switch (txType) {
-          case 'transfer':
-            result = await this._generateTransfer(layer2Client);
-            break;
-          case 'swap':
-            result = await this._generateSwap(layer2Client);
-            break;
-          case 'nft_mint':
-            result = await this._generateNftMint(nftClient);
-            break;
-          case 'nft_transfer':
-            result = await this._generateNftTransfer(nftClient);
-            break;
-          case 'nft_burn':
-            result = await this._generateNftBurn(nftClient);
-            break;
-        }
+        const result = await generators[txType]();
         
         const endTime = Date.now();
         const latency = endTime - startTime;
@@ -210,17 +207,24 @@ class StressTestCoordinator {
         this.results.errors[errorType] = (this.results.errors[errorType] || 0) + 1;
       }
       
-      const totalLatency = this.results.averageLatency * (this.results.totalTransactions - 1) + message.latency;
-      this.results.averageLatency = totalLatency / this.results.totalTransactions;
+      this.totalLatency += message.latency;
     }
   }
   
+  /**
+   * Derive the average latency from the running latency sum
+   */
+  _updateAverageLatency() {
+    this.results.averageLatency = this.totalLatency / Math.max(1, this.results.totalTransactions);
+  }
+  
   /**
    * Monitor test progress
    */
   _monitorProgress() {
     const elapsedSeconds = (Date.now() - this.startTime) / 1000;
     const currentTps = this.results.totalTransactions / elapsedSeconds;
+    this._updateAverageLatency();
     
     if (currentTps > this.results.maxTps) {
       this.results.maxTps = currentTps;
@@ -254,33 +258,39 @@ class StressTestCoordinator {
     
     const testDuration = (this.endTime - this.startTime) / 1000;
     this.results.throughput = this.results.totalTransactions / testDuration;
+    this._updateAverageLatency();
     
-    console.log('\nStress Test Completed');
-    console.log('====================');
-    console.log(`Duration: ${testDuration.toFixed(2)} seconds`);
-    console.log(`Total Transactions: ${this.results.totalTransactions}`);
-    console.log(`Successful Transactions: ${this.results.successfulTransactions}`);
-    console.log(`Failed Transactions: ${this.results.failedTransactions}`);
-    console.log(`Success Rate: ${((this.results.successfulTransactions / Math.max(1, this.results.totalTransactions)) * 100).toFixed(2)}%`);
-    console.log(`Average Throughput: ${this.results.throughput.toFixed(2)} TPS`);
-    console.log(`Maximum TPS: ${this.results.maxTps.toFixed(2)}`);
-    console.log(`Average Latency: ${this.results.averageLatency.toFixed(2)} ms`);
+    // Build the summary first and print it in one write so worker output cannot interleave
+    const summary = [
+      '\nStress Test Completed',
+      '====================',
+      `Duration: ${testDuration.toFixed(2)} seconds`,
+      `Total Transactions: ${this.results.totalTransactions}`,
+      `Successful Transactions: ${this.results.successfulTransactions}`,
+      `Failed Transactions: ${this.results.failedTransactions}`,
+      `Success Rate: ${((this.results.successfulTransactions / Math.max(1, this.results.totalTransactions)) * 100).toFixed(2)}%`,
+      `Average Throughput: ${this.results.throughput.toFixed(2)} TPS`,
+      `Maximum TPS: ${this.results.maxTps.toFixed(2)}`,
+      `Average Latency: ${this.results.averageLatency.toFixed(2)} ms`
+    ];
     
     if (this.results.breakingPoint) {
-      console.log(`Breaking Point: ${this.results.breakingPoint.tps.toFixed(2)} TPS ` +
-                  `(${(this.results.breakingPoint.successRate * 100).toFixed(2)}% success rate)`);
+      summary.push(`Breaking Point: ${this.results.breakingPoint.tps.toFixed(2)} TPS ` +
+                   `(${(this.results.breakingPoint.successRate * 100).toFixed(2)}% success rate)`);
     } else {
-      console.log('No breaking point detected');
+      summary.push('No breaking point detected');
     }
     
-    console.log('\nError Distribution:');
+    summary.push('\nError Distribution:');
     for (const [errorType, count] of Object.entries(this.results.errors)) {
-      console.log(`  ${errorType}: ${count} (${((count / this.results.failedTransactions) * 100).toFixed(2)}%)`);
+      summary.push(`  ${errorType}: ${count} (${((count / this.results.failedTransactions) * 100).toFixed(2)}%)`);
     }
     
     const resultsFile = path.join(CONFIG.outputDir, `stress_test_${this.startTime}.json`);
     fs.writeFileSync(resultsFile, JSON.stringify(this.results, null, 2));
-    console.log(`\nResults saved to ${resultsFile}`);
+    summary.push(`\nResults saved to ${resultsFile}`);
+    
+    console.log(summary.join('\n'));
     
     for (const worker of this.workers) {
       worker.send({ type: 'shutdown' });
@@ -292,12 +302,10 @@ class StressTestCoordinator {
    */
   _selectTransactionType() {
     const random = Math.random();
-    let cumulativeWeight = 0;
     
-    for (const txType of CONFIG.transactionTypes) {
-      cumulativeWeight += txType.weight;
-      if (random < cumulativeWeight) {
-        return txType.type;
+    for (let i = 0; i < CUMULATIVE_TX_WEIGHTS.length; i++) {
+      if (random < CUMULATIVE_TX_WEIGHTS[i]) {
+        return CONFIG.transactionTypes[i].type;
       }
     }
     